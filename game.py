@@ -3,6 +3,8 @@ import os
 import math
 import random
 import sys
+import numpy as np
+from collections import deque
 from dataclasses import dataclass, field
 from typing import List, Tuple
 
@@ -13,8 +15,9 @@ WHITE, BG_COLOR, UI_BG = (255, 255, 255), (7, 10, 20), (20, 24, 30)
 RED, YELLOW = (235, 80, 80), (255, 210, 70)
 SHIP_W, SHIP_H = 80, 60
 BULLET_W, BULLET_H = 10, 5
-MAX_BULLETS, METEOR_COUNT = 4, 3
+MAX_BULLETS, METEOR_COUNT, MAX_PARTICLES = 4, 3, 400
 BULLET_SPEED, SHIP_ACCEL, SHIP_DRAG, METEOR_VEL = 850.0, 2400.0, 12.0, 70.0
+METEOR_SIZE = 50
 
 BORDER = pygame.Rect(WIDTH // 2 - 5, 0, 10, HEIGHT)
 YELLOW_HIT, RED_HIT = pygame.USEREVENT + 1, pygame.USEREVENT + 2
@@ -32,75 +35,190 @@ def safe_load_sound(path):
     try: return pygame.mixer.Sound(os.path.join(ASSETS, path))
     except: return None
 
-# ----------------- ENTITIES -----------------
-@dataclass
-class Particle:
-    pos: pygame.Vector2; vel: pygame.Vector2; color: tuple; life: float; size: float
-    def update(self, dt):
-        self.pos += self.vel * dt
-        self.life -= dt
-        self.size = max(0.0, self.size - dt * 10)
-    def is_dead(self): return self.life <= 0 or self.size <= 0
+# Fused particle advance: with numba the whole step is one compiled loop
+# over the SoA columns; without it, fall back to in-place NumPy ops.
+try:
+    from numba import njit
+
+    @njit(cache=True, fastmath=True)
+    def _advance_particles(pos, vel, life, size, dt):
+        for i in range(pos.shape[0]):
+            pos[i, 0] += vel[i, 0] * dt
+            pos[i, 1] += vel[i, 1] * dt
+            life[i] -= dt
+            s = size[i] - 10.0 * dt
+            size[i] = s if s > 0.0 else 0.0
+except ImportError:
+    def _advance_particles(pos, vel, life, size, dt):
+        pos += vel * dt
+        life -= dt
+        size -= 10.0 * dt
+        np.maximum(size, 0.0, out=size)
+
+# 256 precomputed unit vectors for meteor headings — respawn picks an
+# index instead of computing trig, and batch respawns can index in bulk.
+_UNIT_DIRS = np.stack([np.cos(_a := np.linspace(0, 2 * np.pi, 256, endpoint=False)),
+                       np.sin(_a)], axis=1).astype(np.float32)
 
+# Normalized thrust direction per 4-bit pressed-key mask (bit order: up,
+# down, left, right) — replaces per-frame branch + normalize in Ship.update.
+_DIR_LUT = []
+for _m in range(16):
+    _dx, _dy = (_m >> 3 & 1) - (_m >> 2 & 1), (_m >> 1 & 1) - (_m & 1)
+    _inv = 1.0 / math.hypot(_dx, _dy) if (_dx or _dy) else 0.0
+    _DIR_LUT.append((_dx * _inv, _dy * _inv))
+
+# ----------------- ENTITIES -----------------
 class Bullet:
-    def __init__(self, pos, speed, owner_name, color):
+    def __init__(self, pos, speed, owner, color, owner_idx=0):
         self.rect = pygame.Rect(pos[0], pos[1], BULLET_W, BULLET_H)
-        self.vel_x, self.owner, self.color = speed, owner_name, color
-        self.trail, self.life = [], 2.0
+        self.vel_x, self.owner, self.color = speed, owner, color
+        self.owner_idx = owner_idx  # index into SpaceFight.ships; cheap to compare in bulk
+        self.trail, self.life = deque(maxlen=7), 2.0
+        self.alive = True
+
+    @classmethod
+    def empty(cls):
+        b = cls((0, 0), 0.0, None, WHITE)
+        b.alive = False
+        return b
+
+    def reset(self, pos, speed, owner, color, owner_idx):
+        self.rect.topleft = pos
+        self.vel_x, self.owner, self.color, self.owner_idx = speed, owner, color, owner_idx
+        self.trail.clear()
+        self.life, self.alive = 2.0, True
 
     def update(self, dt):
         self.rect.x += int(self.vel_x * dt)
         self.life -= dt
         self.trail.append(self.rect.center)
-        if len(self.trail) > 7: self.trail.pop(0)
 
 class Ship:
     def __init__(self, x, y, color, controls, shoot_key, img, bullet_speed):
-        self.pos = pygame.Vector2(x, y)
-        self.vel = pygame.Vector2(0, 0)
+        # Plain floats: the integration below never needs Vector2 methods,
+        # and scalar math avoids the per-op Vector2 allocations.
+        self.x, self.y = float(x), float(y)
+        self.vx = self.vy = 0.0
+        self.rect = pygame.Rect(int(x), int(y), SHIP_W, SHIP_H)
         self.color, self.controls, self.shoot_key = color, controls, shoot_key
         self.img, self.bullet_speed = img, bullet_speed
         self.health = 10.0
         self.display_health = 10.0
 
-    def get_rect(self): return pygame.Rect(int(self.pos.x), int(self.pos.y), SHIP_W, SHIP_H)
+    def get_rect(self): return self.rect  # kept as a thin accessor
+
+    def update(self, dt, area, keys):
+        mask = (keys[self.controls[0]] | keys[self.controls[1]] << 1
+                | keys[self.controls[2]] << 2 | keys[self.controls[3]] << 3)
+        dx, dy = _DIR_LUT[mask]
+        if dx or dy:
+            self.vx += dx * SHIP_ACCEL * dt
+            self.vy += dy * SHIP_ACCEL * dt
+        drag = min(1.0, SHIP_DRAG * dt)
+        self.vx -= self.vx * drag
+        self.vy -= self.vy * drag
 
-    def update(self, dt, area):
-        keys = pygame.key.get_pressed()
-        acc = pygame.Vector2(0, 0)
-        if keys[self.controls[0]]: acc.y -= 1 # Up
-        if keys[self.controls[1]]: acc.y += 1 # Down
-        if keys[self.controls[2]]: acc.x -= 1 # Left
-        if keys[self.controls[3]]: acc.x += 1 # Right
-        
-        if acc.length_squared() > 0: self.vel += acc.normalize() * SHIP_ACCEL * dt
-        self.vel -= self.vel * min(1.0, SHIP_DRAG * dt)
-        self.pos += self.vel * dt
-        
         # Constrain to area
-        self.pos.x = max(area.left, min(area.right - SHIP_W, self.pos.x))
-        self.pos.y = max(area.top, min(area.bottom - SHIP_H, self.pos.y))
+        self.x = max(area.left, min(area.right - SHIP_W, self.x + self.vx * dt))
+        self.y = max(area.top, min(area.bottom - SHIP_H, self.y + self.vy * dt))
+        self.rect.x, self.rect.y = int(self.x), int(self.y)
         self.display_health += (self.health - self.display_health) * dt * 6
 
 @dataclass
 class Meteor:
     rect: pygame.Rect; vx: float; vy: float; angle: float = 0.0; rot_speed: float = 0.0
+    def __post_init__(self):
+        # Accumulate position as floats (same pattern as Ship): stepping the
+        # int rect directly truncates sub-pixel motion, which froze any
+        # velocity component under one pixel per frame.
+        self.x, self.y = float(self.rect.x), float(self.rect.y)
+
     def update(self, dt):
-        self.rect.x += int(self.vx * dt)
-        self.rect.y += int(self.vy * dt)
+        self.x += self.vx * dt
+        self.y += self.vy * dt
         self.angle = (self.angle + self.rot_speed * dt) % 360
-        if self.rect.left > WIDTH: self.rect.right = 0
-        elif self.rect.right < 0: self.rect.left = WIDTH
-        if self.rect.top > HEIGHT: self.rect.bottom = 0
-        elif self.rect.bottom < 0: self.rect.top = HEIGHT
+        if self.x > WIDTH: self.x = -METEOR_SIZE
+        elif self.x + METEOR_SIZE < 0: self.x = WIDTH
+        if self.y > HEIGHT: self.y = -METEOR_SIZE
+        elif self.y + METEOR_SIZE < 0: self.y = HEIGHT
+        self.rect.x, self.rect.y = int(self.x), int(self.y)
+
+class ParticleSystem:
+    """SoA particle pool: parallel NumPy columns plus a live-count cursor."""
+    def __init__(self, capacity=MAX_PARTICLES):
+        self.capacity = capacity
+        self.pos = np.zeros((capacity, 2), np.float32)
+        self.vel = np.zeros((capacity, 2), np.float32)
+        self.color = np.zeros((capacity, 3), np.uint8)
+        self.life = np.zeros(capacity, np.float32)
+        self.size = np.zeros(capacity, np.float32)
+        self.count = 0
+        self.rng = np.random.default_rng()
+
+    def spawn(self, pos, color, count=15):
+        # Fill the SoA slice with one batched random draw per column
+        # instead of looping count times through Python RNG + Vector2.
+        n = min(count, self.capacity - self.count)
+        if n <= 0: return
+        i, j = self.count, self.count + n
+        angs = self.rng.uniform(0, 2 * np.pi, n)
+        speeds = self.rng.uniform(50, 200, n)
+        self.pos[i:j] = pos
+        self.vel[i:j, 0] = np.cos(angs) * speeds
+        self.vel[i:j, 1] = np.sin(angs) * speeds
+        self.color[i:j] = color
+        self.life[i:j] = self.rng.uniform(0.4, 0.8, n)
+        self.size[i:j] = self.rng.uniform(2, 5, n)
+        self.count = j
+
+    def update(self, dt):
+        # Advance and cull all particles with a handful of array ops.
+        n = self.count
+        if not n: return
+        _advance_particles(self.pos[:n], self.vel[:n], self.life[:n], self.size[:n], dt)
+        alive = (self.life[:n] > 0) & (self.size[:n] > 0)
+        k = int(alive.sum())
+        if k < n:
+            for arr in (self.pos, self.vel, self.color, self.life, self.size):
+                arr[:k] = arr[:n][alive]
+            self.count = k
+
+class SpatialHashGrid:
+    """Uniform-grid broadphase; the cell dict is reused across frames."""
+    def __init__(self, cell=64):
+        self.cell = cell
+        self.cells = {}
+
+    def clear(self): self.cells.clear()
+
+    def insert(self, idx, l, t, r, b):
+        c = self.cell
+        for cx in range(int(l) // c, int(r) // c + 1):
+            for cy in range(int(t) // c, int(b) // c + 1):
+                self.cells.setdefault((cx, cy), []).append(idx)
+
+    def query(self, l, t, r, b):
+        c = self.cell
+        out = set()
+        for cx in range(int(l) // c, int(r) // c + 1):
+            for cy in range(int(t) // c, int(b) // c + 1):
+                out.update(self.cells.get((cx, cy), ()))
+        return out
 
 class ScreenShake:
-    def __init__(self): self.timer, self.magnitude = 0, 0
-    def trigger(self, mag=10, dur=0.3): self.timer, self.magnitude = dur, mag
+    # Offsets are rolled once per trigger into a small table; each frame
+    # just walks the table instead of calling the RNG twice.
+    def __init__(self): self.timer, self.magnitude, self.lut, self.idx = 0, 0, [(0, 0)], 0
+    def trigger(self, mag=10, dur=0.3):
+        self.timer, self.magnitude = dur, mag
+        self.lut = [(random.randint(-1, 1) * mag, random.randint(-1, 1) * mag) for _ in range(128)]
+        self.idx = 0
     def get_offset(self, dt):
         if self.timer > 0:
             self.timer -= dt
-            return (random.randint(-1, 1) * self.magnitude, random.randint(-1, 1) * self.magnitude)
+            self.idx = (self.idx + 1) & 127
+            return self.lut[self.idx % len(self.lut)]
         return (0, 0)
 
 # ----------------- MAIN GAME -----------------
@@ -113,8 +231,31 @@ class SpaceFight:
         
         # Assets
         self.bg = safe_load_image("space.png", (WIDTH, HEIGHT))
-        self.meteor_img = safe_load_image("meteor.png", (50, 50))
+        # Double-width scroll strip: one source-rect blit per frame instead
+        # of blitting the background twice.
+        self.bg_wide = None
+        if self.bg:
+            self.bg_wide = pygame.Surface((WIDTH * 2, HEIGHT))
+            self.bg_wide.blit(self.bg, (0, 0))
+            self.bg_wide.blit(self.bg, (WIDTH, 0))
+            self.bg_wide = self.bg_wide.convert()
+        self.meteor_img = safe_load_image("meteor.png", (METEOR_SIZE, METEOR_SIZE))
+        # Pre-bake rotated meteor frames (4 degree steps) with their half
+        # sizes so draw() never calls transform.rotate or get_rect.
+        # rotozoom filters while it rotates, so the baked frames look
+        # smooth at no per-frame cost.
+        self.meteor_rot = []
+        if self.meteor_img:
+            for a in range(0, 360, 4):
+                surf = pygame.transform.rotozoom(self.meteor_img, a, 1.0).convert_alpha()
+                w, h = surf.get_size()
+                self.meteor_rot.append((surf, w // 2, h // 2))
         self.snd_laser, self.snd_hit = safe_load_sound("laser.wav"), safe_load_sound("explosion.wav")
+        # Round-robin channel pool: playback never scans for a free channel.
+        self._sfx_channels, self._sfx_idx = [], 0
+        if pygame.mixer.get_init():
+            pygame.mixer.set_num_channels(16)
+            self._sfx_channels = [pygame.mixer.Channel(i) for i in range(16)]
 
         # Players
         y_ctrls = (pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d)
@@ -126,99 +267,279 @@ class SpaceFight:
                         safe_load_image("spaceship_red.png", (SHIP_W, SHIP_H), 270), -BULLET_SPEED)
         
         self.ships = [self.yellow, self.red]
-        self.bullets, self.meteors, self.particles = [], [], []
+        self.ship_rects = [s.rect for s in self.ships]  # rects update in place
+        # Fixed pool of bullet slots: firing reuses a dead slot, hits just
+        # drop the alive flag — the list itself never changes shape.
+        self.bullets = [Bullet.empty() for _ in range(MAX_BULLETS * 2)]
+        self.meteors = []
+
+        self.particles = ParticleSystem()
+        self._grid = SpatialHashGrid()  # broadphase for large entity counts
         self.shake, self.hit_flash, self.bg_off = ScreenShake(), 0.0, 0.0
+        self._glow_cache = {}  # (r, g, b, size, alpha) -> prerendered dot surface
+        self._hud_text_cache = {}  # int health -> rendered label, at most 11 entries
+        self._trail_fade = {}  # bullet color -> 7 pre-blended fade colors
+        # Bullet size is constant, so each color's glow halo is one
+        # surface built up front, never per frame.
+        self._bullet_glow = {c: self._make_glow(c) for c in (YELLOW, RED)}
+        self._flash_surf = pygame.Surface((WIDTH, HEIGHT)).convert()
+        self._flash_surf.fill(WHITE)
+        # Static HUD chrome composed once; draw() blits it in one call.
+        self.hud_bg = pygame.Surface((WIDTH, 30), pygame.SRCALPHA)
+        pygame.draw.rect(self.hud_bg, UI_BG, (10, 10, 220, 15))
+        pygame.draw.rect(self.hud_bg, UI_BG, (WIDTH - 230, 10, 220, 15))
+        self.hud_bg = self.hud_bg.convert_alpha()
+        self._hud_last = None
+        self._prev_dirty, self._last_bg_off = [], -1
+        self._last_offset, self._last_flash = (0, 0), False
+
+        # Only the events we dispatch on ever reach the queue; everything
+        # else (mouse motion etc.) is dropped inside SDL.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, YELLOW_HIT, RED_HIT])
+        self._ev_handlers = {pygame.KEYDOWN: self._on_keydown}
         for _ in range(METEOR_COUNT): self._spawn_meteor()
 
     def _spawn_meteor(self):
-        vx, vy = random.choice([-1, 1]) * METEOR_VEL, random.choice([-1, 1]) * METEOR_VEL
-        self.meteors.append(Meteor(pygame.Rect(WIDTH//2, random.randint(0, HEIGHT), 50, 50), vx, vy, 0, random.uniform(-90, 90)))
+        d = _UNIT_DIRS[random.randrange(256)]
+        vx, vy = float(d[0]) * METEOR_VEL, float(d[1]) * METEOR_VEL
+        self.meteors.append(Meteor(pygame.Rect(WIDTH//2, random.randint(0, HEIGHT), METEOR_SIZE, METEOR_SIZE), vx, vy, 0, random.uniform(-90, 90)))
+
+    def _play_sound(self, snd):
+        if not snd or not self._sfx_channels: return
+        ch = self._sfx_channels[self._sfx_idx]
+        self._sfx_idx = (self._sfx_idx + 1) & 15
+        if not ch.get_busy(): ch.play(snd)
+
+    def _dot_surf(self, color, size, alpha=255):
+        # Tiny translucent dots are identical across frames; render each
+        # (color, size, alpha) combination once and blit it from the cache.
+        key = (*color, size, alpha)
+        surf = self._glow_cache.get(key)
+        if surf is None:
+            surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(surf, (*color, alpha), (size, size), size)
+            self._glow_cache[key] = surf = surf.convert_alpha()
+        return surf
 
-    def _spawn_particles(self, pos, color, count=15):
-        for _ in range(count):
-            vel = pygame.Vector2(random.uniform(-1, 1), random.uniform(-1, 1)).normalize() * random.uniform(50, 200)
-            self.particles.append(Particle(pygame.Vector2(pos), vel, color, random.uniform(0.4, 0.8), random.uniform(2, 5)))
+    @staticmethod
+    def _make_glow(color):
+        surf = pygame.Surface((BULLET_W * 3, BULLET_H * 3), pygame.SRCALPHA)
+        pygame.draw.ellipse(surf, (*color, 70), surf.get_rect())
+        return surf.convert_alpha()
+
+    def _trail_colors(self, color):
+        # Fade is baked into per-slot colors blended toward the background,
+        # computed once per bullet color.
+        cols = self._trail_fade.get(color)
+        if cols is None:
+            cols = [tuple(bc + (c - bc) * i // 7 for c, bc in zip(color, BG_COLOR))
+                    for i in range(7)]
+            self._trail_fade[color] = cols
+        return cols
+
+    def _on_keydown(self, event):
+        if event.key == self.yellow.shoot_key: self.handle_fire(self.yellow)
+        if event.key == self.red.shoot_key: self.handle_fire(self.red)
 
     def handle_fire(self, ship):
-        if sum(1 for b in self.bullets if b.owner == ship) < MAX_BULLETS:
-            start_x = ship.get_rect().right if ship.bullet_speed > 0 else ship.get_rect().left
-            self.bullets.append(Bullet((start_x, ship.get_rect().centery), ship.bullet_speed, ship, ship.color))
-            if self.snd_laser: self.snd_laser.play()
+        if sum(1 for b in self.bullets if b.alive and b.owner is ship) < MAX_BULLETS:
+            slot = next((b for b in self.bullets if not b.alive), None)
+            if slot is None: return
+            r = ship.get_rect()
+            start_x = r.right if ship.bullet_speed > 0 else r.left
+            slot.reset((start_x, r.centery), ship.bullet_speed, ship,
+                       ship.color, self.ships.index(ship))
+            self._play_sound(self.snd_laser)
 
     def update(self, dt):
         self.hit_flash = max(0.0, self.hit_flash - dt * 3)
         self.bg_off = (self.bg_off + dt * 20) % WIDTH
         
-        # Ship areas
-        self.yellow.update(dt, pygame.Rect(0, 0, BORDER.left, HEIGHT))
-        self.red.update(dt, pygame.Rect(BORDER.right, 0, WIDTH - BORDER.right, HEIGHT))
+        # Ship areas; one SDL key-state query shared by both ships
+        keys = pygame.key.get_pressed()
+        self.yellow.update(dt, pygame.Rect(0, 0, BORDER.left, HEIGHT), keys)
+        self.red.update(dt, pygame.Rect(BORDER.right, 0, WIDTH - BORDER.right, HEIGHT), keys)
 
         for m in self.meteors: m.update(dt)
-        for p in self.particles[:]:
-            p.update(dt)
-            if p.is_dead(): self.particles.remove(p)
 
-        for b in self.bullets[:]:
+        self.particles.update(dt)
+
+        # Bullets only move horizontally, so two scalar compares replace
+        # the four-sided contains() check against the screen rect.
+        for b in self.bullets:
+            if not b.alive: continue
             b.update(dt)
-            if b.life <= 0 or not self.screen.get_rect().contains(b.rect):
-                self.bullets.remove(b); continue
-            
-            # Bullet Collisions
-            for s in self.ships:
-                if s != b.owner and s.get_rect().colliderect(b.rect):
-                    s.health -= 1
-                    self.shake.trigger()
-                    self.hit_flash = 0.5
-                    self._spawn_particles(b.rect.center, s.color, 20)
-                    if self.snd_hit: self.snd_hit.play()
-                    self.bullets.remove(b)
-                    break
+            if b.life <= 0 or b.rect.right < 0 or b.rect.left > WIDTH:
+                b.alive = False
+
+        self._collide_bullets()
+
+    def _collide_bullets(self):
+        # Broadcasted AABB tests over SoA edge arrays: a few C-level array ops
+        # instead of per-pair colliderect calls in Python.
+        live = [b for b in self.bullets if b.alive]
+        if not live: return
+        n = len(live)
+        bl = np.fromiter((b.rect.left for b in live), np.float32, n)
+        bt = np.fromiter((b.rect.top for b in live), np.float32, n)
+        br, bb = bl + BULLET_W, bt + BULLET_H
+
+        dead = np.zeros(n, dtype=bool)
+        if self.meteors:
+            m = len(self.meteors)
+            ml = np.fromiter((mt_.rect.left for mt_ in self.meteors), np.float32, m)
+            mt = np.fromiter((mt_.rect.top for mt_ in self.meteors), np.float32, m)
+            mr, mb = ml + METEOR_SIZE, mt + METEOR_SIZE
+            if n * m <= 1024:
+                # Small pair counts: the dense broadcast is a few C ops.
+                hits = (bl[:, None] < mr) & (br[:, None] > ml) & (bt[:, None] < mb) & (bb[:, None] > mt)
+                hit_any = hits.any(axis=1)
+                first = np.argmax(hits, axis=1)
+            else:
+                # Large swarms: prune pairs through the uniform grid first.
+                self._grid.clear()
+                for j in range(m): self._grid.insert(j, ml[j], mt[j], mr[j], mb[j])
+                hit_any = np.zeros(n, bool)
+                first = np.zeros(n, np.intp)
+                for i in range(n):
+                    for j in self._grid.query(bl[i], bt[i], br[i], bb[i]):
+                        if bl[i] < mr[j] and br[i] > ml[j] and bt[i] < mb[j] and bb[i] > mt[j]:
+                            hit_any[i], first[i] = True, j
+                            break
+            dead_meteors = set()
+            for i in np.nonzero(hit_any)[0]:
+                j = int(first[i])
+                if j not in dead_meteors:
+                    dead_meteors.add(j)
+                    self.particles.spawn(self.meteors[j].rect.center, WHITE)
+                    self._play_sound(self.snd_hit)
+                dead[i] = True
+            if dead_meteors:
+                self.meteors = [mt_ for j, mt_ in enumerate(self.meteors) if j not in dead_meteors]
+                for _ in dead_meteors: self._spawn_meteor()
+
+        owner_idx = np.fromiter((b.owner_idx for b in live), np.int8, n)
+        for si, (s, r) in enumerate(zip(self.ships, self.ship_rects)):
+            ship_hit = (owner_idx != si) & ~dead & (bl < r.right) & (br > r.left) & (bt < r.bottom) & (bb > r.top)
+            for i in np.nonzero(ship_hit)[0]:
+                s.health -= 1
+                self.shake.trigger()
+                self.hit_flash = 0.5
+                self.particles.spawn(live[i].rect.center, s.color, 20)
+                self._play_sound(self.snd_hit)
+                dead[i] = True
+
+        for i in np.nonzero(dead)[0]:
+            live[i].alive = False
 
     def draw(self, offset):
         self.screen.fill(BG_COLOR)
-        if self.bg:
-            self.screen.blit(self.bg, (-self.bg_off + offset[0], offset[1]))
-            self.screen.blit(self.bg, (WIDTH - self.bg_off + offset[0], offset[1]))
+        if self.bg_wide:
+            self.screen.blit(self.bg_wide, offset, pygame.Rect(int(self.bg_off), 0, WIDTH, HEIGHT))
         
         pygame.draw.rect(self.screen, (15, 15, 25), BORDER)
         
+        # Trails as fading line segments: a few draw calls per bullet and
+        # zero surface allocations.
         for b in self.bullets:
-            for i, pt in enumerate(b.trail):
-                alpha = int(255 * (i/len(b.trail)))
-                pygame.draw.circle(self.screen, (*b.color, alpha), pt, 2)
+            if not b.alive: continue
+            pts = list(b.trail)
+            if len(pts) >= 2:
+                cols = self._trail_colors(b.color)
+                for i in range(len(pts) - 1):
+                    pygame.draw.aaline(self.screen, cols[i], pts[i], pts[i + 1])
+            glow = self._bullet_glow.get(b.color)
+            if glow: self.screen.blit(glow, (b.rect.x - BULLET_W, b.rect.y - BULLET_H))
             pygame.draw.rect(self.screen, b.color, b.rect)
 
-        for s in self.ships:
-            if s.img: self.screen.blit(s.img, s.get_rect().topleft)
-            else: pygame.draw.rect(self.screen, s.color, s.get_rect())
-            # Health Bar
+        self.screen.blit(self.hud_bg, (0, 0))
+        for s, r in zip(self.ships, self.ship_rects):
+            if s.img: self.screen.blit(s.img, r.topleft)
+            else: pygame.draw.rect(self.screen, s.color, r)
+            # Health Bar fill (the frame comes from the static hud_bg blit)
             bar_x = 10 if s == self.yellow else WIDTH - 230
-            pygame.draw.rect(self.screen, UI_BG, (bar_x, 10, 220, 15))
             pygame.draw.rect(self.screen, s.color, (bar_x+2, 12, int(216 * (s.display_health/10)), 11))
+            # Font rasterization is slow; health only takes 11 values, so
+            # render each label once and reuse it.
+            key = int(s.health)
+            label = self._hud_text_cache.get(key)
+            if label is None:
+                label = self._hud_text_cache[key] = self.font.render(str(key), True, WHITE)
+            self.screen.blit(label, (bar_x + 98, 27))
 
         for m in self.meteors:
-            if self.meteor_img:
-                rot = pygame.transform.rotate(self.meteor_img, m.angle)
-                self.screen.blit(rot, rot.get_rect(center=m.rect.center).topleft)
+            if self.meteor_rot:
+                surf, hw, hh = self.meteor_rot[int(m.angle) // 4 % len(self.meteor_rot)]
+                self.screen.blit(surf, (m.rect.centerx - hw, m.rect.centery - hh))
 
-        for p in self.particles:
-            pygame.draw.circle(self.screen, p.color, (int(p.pos.x), int(p.pos.y)), int(p.size))
+        ps = self.particles
+        particle_blits = []
+        for i in range(ps.count):
+            size = int(ps.size[i])
+            if size == 0: continue
+            c = ps.color[i]
+            surf = self._dot_surf((int(c[0]), int(c[1]), int(c[2])), size)
+            particle_blits.append((surf, (int(ps.pos[i, 0]) - size, int(ps.pos[i, 1]) - size)))
+        if particle_blits: self.screen.blits(particle_blits, doreturn=False)
 
         if self.hit_flash > 0:
-            s = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            s.fill((255, 255, 255, int(self.hit_flash * 100)))
-            self.screen.blit(s, (0, 0))
+            # One persistent white surface; only its alpha changes per frame.
+            self._flash_surf.set_alpha(int(self.hit_flash * 100))
+            self.screen.blit(self._flash_surf, (0, 0))
+
+        self._present(offset)
+
+    def _collect_dirty_rects(self):
+        # The ship sprites are rotated 90 degrees, so the blitted image is
+        # taller than the logical rect; dirty the drawn extent, not the rect.
+        dirty = [pygame.Rect(s.rect.topleft, s.img.get_size() if s.img else s.rect.size)
+                 for s in self.ships]
+        # HUD regions only go dirty when a fill width or label changed.
+        hud_state = tuple(int(216 * (s.display_health / 10)) for s in self.ships) \
+            + tuple(int(s.health) for s in self.ships)
+        if hud_state != self._hud_last:
+            self._hud_last = hud_state
+            dirty.append(pygame.Rect(10, 10, 220, 40))
+            dirty.append(pygame.Rect(WIDTH - 230, 10, 220, 40))
+        for b in self.bullets:
+            if not b.alive: continue
+            r = b.rect.inflate(BULLET_W * 2, BULLET_H * 2)  # covers the glow halo
+            for pt in b.trail: r.union_ip(pygame.Rect(pt[0] - 2, pt[1] - 2, 4, 4))
+            dirty.append(r)
+        half = int(METEOR_SIZE * 0.71) + 1  # rotated frames reach size*sqrt(2)
+        for m in self.meteors:
+            dirty.append(pygame.Rect(m.rect.centerx - half, m.rect.centery - half, half * 2, half * 2))
+        if self.particles.count:
+            x0, y0 = self.particles.pos[:self.particles.count].min(axis=0)
+            x1, y1 = self.particles.pos[:self.particles.count].max(axis=0)
+            dirty.append(pygame.Rect(int(x0) - 6, int(y0) - 6, int(x1 - x0) + 12, int(y1 - y0) + 12))
+        return dirty
 
-        pygame.display.flip()
+    def _present(self, offset):
+        # Push only the regions that changed; fall back to a full flip on
+        # frames where the background scrolled, the screen shook or flashed,
+        # and on the frames where shake or flash just ended — the window
+        # still shows last frame's shifted/tinted content outside the
+        # dirty rects until something repaints it whole.
+        dirty = self._collect_dirty_rects()
+        flashing = self.hit_flash > 0
+        full = (offset != (0, 0) or flashing
+                or offset != self._last_offset or flashing != self._last_flash
+                or int(self.bg_off) != self._last_bg_off)
+        self._last_offset, self._last_flash = offset, flashing
+        self._last_bg_off = int(self.bg_off)
+        if full: pygame.display.flip()
+        else: pygame.display.update(self._prev_dirty + dirty)
+        self._prev_dirty = dirty
 
     def run(self):
         while True:
             dt = self.clock.tick(FPS) / 1000.0
             for event in pygame.event.get():
                 if event.type == pygame.QUIT: return
-                if event.type == pygame.KEYDOWN:
-                    if event.key == self.yellow.shoot_key: self.handle_fire(self.yellow)
-                    if event.key == self.red.shoot_key: self.handle_fire(self.red)
+                handler = self._ev_handlers.get(event.type)
+                if handler: handler(event)
 
             self.update(dt)
             self.draw(self.shake.get_offset(dt))